@@ -1,73 +1,83 @@
+from collections import namedtuple
+from functools import lru_cache, wraps
+
 from fastapi import Request
-from fastapi.responses import JSONResponse
-from functools import wraps
-from .payment import verify_jwt, verify_onchain
+from fastapi.responses import JSONResponse, Response
+
+from .payment import SOLANA_RPC_URL, verify_jwt, verify_onchain
 from .phone_verification import check_phone_verified
-import yaml
-from functools import wraps
-from langchain.schema import LLMResult
 
-from solana.rpc.api import Client as SolanaClient
+Identity = namedtuple("Identity", "token wallet")
+
+def _extract_identity(request: Request) -> Identity:
+    """
+    Single pass over the raw ASGI headers (already lower-cased bytes)
+    instead of one case-insensitive Headers.get scan per header.
+    The token comes back with any "Bearer " prefix (any case) stripped.
+    """
+    token = wallet = None
+    for key, value in request.scope["headers"]:
+        if key == b"authorization" and token is None:
+            # Only lower-case the 7-byte scheme, and decode just the token
+            if value[:7].lower() == b"bearer ":
+                value = value[7:]
+            token = value.decode("latin-1")
+        elif key == b"x-wallet-address" and wallet is None:
+            wallet = value.decode("latin-1")
+    return Identity(token, wallet)
+
+# Pre-rendered JSON bodies; JSONResponse is only used to serialize them once
+_PHONE_REQUIRED_BODY = JSONResponse({
+    "error": "Phone verification required",
+    "verify_url": "https://modelex.ai/verify"
+}).body
 
 def modelex_paywall(price: float, currency: str = "TRUSD", phone_required: bool = False):
+    # Everything in the 402 body is fixed at decoration time
+    payment_required_body = JSONResponse({
+        "error": "Payment required",
+        "price": price,
+        "currency": currency,
+        "payment_endpoint": "https://pay.modelex.ai/pay",
+        "phone_required": phone_required
+    }).body
+
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, request: Request, **kwargs):
             # 1) Safely get headers
-            token = request.headers.get("Authorization")
-            wallet = request.headers.get("X-Wallet-Address")
-
-            if token and token.startswith("Bearer "):
-                token = token.replace("Bearer ", "")
+            token, wallet = _extract_identity(request)
 
             paid = False
             if token:
                 paid = verify_jwt(token, min_amount=price)
             if not paid and wallet:
-                paid = verify_onchain(wallet, min_amount=price)
+                paid = await verify_onchain(wallet, min_amount=price)
 
             if not paid:
-                return JSONResponse(
-                    status_code=402,
-                    content={
-                        "error": "Payment required",
-                        "price": price,
-                        "currency": currency,
-                        "payment_endpoint": "https://pay.modelex.ai/pay",
-                        "phone_required": phone_required
-                    }
-                )
+                return Response(payment_required_body, status_code=402, media_type="application/json")
 
             # 2) Check phone if needed
             if phone_required and not check_phone_verified(request):
-                return JSONResponse(
-                    status_code=402,
-                    content={
-                        "error": "Phone verification required",
-                        "verify_url": "https://modelex.ai/verify"
-                    }
-                )
+                return Response(_PHONE_REQUIRED_BODY, status_code=402, media_type="application/json")
 
             return await func(*args, **kwargs)
         return wrapper
     return decorator
 
 
-import yaml
-from functools import wraps
-from langchain.schema import LLMResult
-
-from solana.rpc.api import Client as SolanaClient  # or your preferred Solana SDK
-
-# Load Modelex config once
-with open("config.yaml", "r") as f:
-    config = yaml.safe_load(f)
-
-AGENT_WALLET = config["wallet_address"]
-RATE_PER_TOKEN = config["rate_per_token"]
-CURRENCY = config["currency"]
-NETWORK = config["network"]
-
-# Optional: initialize your Solana client
-solana_client = SolanaClient("https://api.mainnet-beta.solana.com")
+# Modelex config and the Solana client are created on first use, not at
+# import time, so the paywall imports without config.yaml, PyYAML or the
+# Solana SDK present.
+@lru_cache(maxsize=1)
+def load_config() -> dict:
+    import yaml
+    with open("config.yaml", "r") as f:
+        return yaml.safe_load(f)
 
+# Optional: your Solana client. Async, since verify_onchain runs on the
+# event loop.
+@lru_cache(maxsize=1)
+def get_solana_client():
+    from solana.rpc.async_api import AsyncClient  # or your preferred Solana SDK
+    return AsyncClient(SOLANA_RPC_URL)
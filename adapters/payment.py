@@ -1,32 +1,73 @@
 # modelex_adapter/payment.py
 
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+
 import jwt  # PyJWT
-import requests
+
+logger = logging.getLogger(__name__)
 
 # Example secret for demo — in production, use your Modelex signing key!
 SECRET_KEY = "MODELEX_SECRET"
 
+SOLANA_RPC_URL = "https://api.mainnet-beta.solana.com"
+
+# Clients reuse the same Bearer token across many calls, so keep the
+# decoded amount for a short while instead of re-running the HMAC check
+# and JSON parse every time. Keyed by a digest, never the raw token.
+JWT_CACHE_TTL = 30  # seconds
+JWT_CACHE_SIZE = 4096
+_jwt_cache = OrderedDict()  # digest -> (expires_at in monotonic_ns, amount)
+# Per-process key for the cache digests, so a dumped cache can't be
+# matched against candidate tokens offline
+_JWT_CACHE_PEPPER = os.urandom(16)
+
+def _jwt_amount(token: str) -> float:
+    key = hashlib.blake2b(token.encode(), digest_size=16, key=_JWT_CACHE_PEPPER).digest()
+    now = time.monotonic_ns()
+    entry = _jwt_cache.get(key)
+    if entry is not None and entry[0] > now:
+        _jwt_cache.move_to_end(key)
+        return entry[1]
+
+    # Invalid tokens raise here and are never cached
+    payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    amount = float(payload.get("amount", 0))
+    ttl = JWT_CACHE_TTL
+    if "exp" in payload:
+        # Never serve a cached amount past the token's own expiry
+        ttl = min(ttl, int(payload["exp"]) - time.time())
+    _jwt_cache[key] = (now + int(ttl * 1_000_000_000), amount)
+    _jwt_cache.move_to_end(key)
+    if len(_jwt_cache) > JWT_CACHE_SIZE:
+        _jwt_cache.popitem(last=False)
+    return amount
+
 def verify_jwt(token: str, min_amount: float) -> bool:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-        amount = float(payload.get("amount", 0))
+        amount = _jwt_amount(token)
         if amount >= min_amount:
-            print(f"[Modelex] JWT verified, amount: {amount}")
+            logger.debug("JWT verified, amount: %s", amount)
             return True
         else:
-            print(f"[Modelex] JWT amount too low: {amount} < {min_amount}")
+            logger.debug("JWT amount too low: %s < %s", amount, min_amount)
             return False
     except Exception as e:
-        print(f"[Modelex] JWT verification failed: {e}")
+        logger.debug("JWT verification failed: %s", e)
         return False
 
-def verify_onchain(wallet_address: str, min_amount: float) -> bool:
+async def verify_onchain(wallet_address: str, min_amount: float) -> bool:
     """
     Example: Calls your blockchain indexer or Solana RPC node
-    to confirm payment has occurred.
+    (SOLANA_RPC_URL) to confirm payment has occurred.
+    Awaited from the paywall, so use an async client here
+    (e.g. solana.rpc.async_api.AsyncClient) — a sync RPC call
+    would block the event loop for the full round trip.
     """
     # Replace with your actual on-chain logic!
-    solana_rpc = "https://api.mainnet-beta.solana.com"
     # Do your lookup here...
-    print(f"[Modelex] (Mock) checking on-chain tx for {wallet_address}")
+    logger.debug("(Mock) checking on-chain tx for %s", wallet_address)
     return True  # Always true for stub
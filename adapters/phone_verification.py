@@ -1,8 +1,24 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Accepted spellings of a "true" X-Phone-Verified header, as raw bytes so
+# the value is matched straight from the ASGI scope without decoding.
+_TRUE_VALUES = frozenset({b"true", b"True", b"TRUE"})
+
 def check_phone_verified(request) -> bool:
     """
     Placeholder: check request header or session cookie.
     In production, check your database or external auth provider.
     """
-    phone_verified = request.headers.get("X-Phone-Verified", "false").lower() == "true"
-    print(f"[Modelex] Phone verified: {phone_verified}")
+    scope = getattr(request, "scope", None)
+    if isinstance(scope, dict):
+        value = next((v for k, v in scope["headers"] if k == b"x-phone-verified"), None)
+    else:
+        # Anything else exposing .headers (test doubles, non-ASGI requests)
+        value = request.headers.get("X-Phone-Verified")
+        if value is not None:
+            value = value.encode("latin-1", "replace")
+    phone_verified = value in _TRUE_VALUES
+    logger.debug("Phone verified: %s", phone_verified)
     return phone_verified
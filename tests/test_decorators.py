@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.responses import JSONResponse
+from starlette.requests import Request
+
+from adapters import decorators
+from adapters.decorators import modelex_paywall
+
+
+def _request(*headers):
+    """Starlette request from (name, value) pairs; repeats are kept."""
+    return Request({
+        "type": "http",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+    })
+
+
+@modelex_paywall(price=0.5)
+async def endpoint():
+    return "ok"
+
+
+@modelex_paywall(price=0.5, phone_required=True)
+async def phone_endpoint():
+    return "ok"
+
+
+@pytest.fixture
+def verify_jwt(monkeypatch):
+    mock = Mock(return_value=True)
+    monkeypatch.setattr(decorators, "verify_jwt", mock)
+    return mock
+
+
+@pytest.fixture
+def verify_onchain(monkeypatch):
+    mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(decorators, "verify_onchain", mock)
+    return mock
+
+
+def test_missing_authorization_returns_402(verify_jwt, verify_onchain):
+    result = asyncio.run(endpoint(request=_request()))
+    assert result.status_code == 402
+    verify_jwt.assert_not_called()
+    verify_onchain.assert_not_awaited()
+
+
+def test_duplicate_authorization_first_wins(verify_jwt):
+    request = _request(("Authorization", "Bearer first"), ("Authorization", "Bearer second"))
+    assert asyncio.run(endpoint(request=request)) == "ok"
+    verify_jwt.assert_called_once_with("first", min_amount=0.5)
+
+
+@pytest.mark.parametrize("authorization, token", [
+    ("Bearer abc", "abc"),
+    ("bearer abc", "abc"),
+    ("BEARER abc", "abc"),
+    ("Bearer", "Bearer"),
+    ("abc", "abc"),
+])
+def test_bearer_scheme_stripped_case_insensitively(verify_jwt, authorization, token):
+    assert asyncio.run(endpoint(request=_request(("Authorization", authorization)))) == "ok"
+    verify_jwt.assert_called_once_with(token, min_amount=0.5)
+
+
+def test_wallet_only_awaits_verify_onchain(verify_jwt, verify_onchain):
+    request = _request(("X-Wallet-Address", "wallet123"))
+    assert asyncio.run(endpoint(request=request)) == "ok"
+    verify_jwt.assert_not_called()
+    verify_onchain.assert_awaited_once_with("wallet123", min_amount=0.5)
+
+
+def test_wallet_only_unpaid_returns_402(verify_onchain):
+    verify_onchain.return_value = False
+    result = asyncio.run(endpoint(request=_request(("X-Wallet-Address", "wallet123"))))
+    assert result.status_code == 402
+
+
+def test_payment_required_body_matches_json_response(verify_jwt):
+    verify_jwt.return_value = False
+    result = asyncio.run(phone_endpoint(request=_request(("Authorization", "Bearer x"))))
+    expected = JSONResponse(status_code=402, content={
+        "error": "Payment required",
+        "price": 0.5,
+        "currency": "TRUSD",
+        "payment_endpoint": "https://pay.modelex.ai/pay",
+        "phone_required": True
+    })
+    assert result.status_code == 402
+    assert result.body == expected.body
+    assert result.headers["content-type"] == expected.headers["content-type"]
+
+
+def test_phone_required_body_matches_json_response(verify_jwt):
+    result = asyncio.run(phone_endpoint(request=_request(("Authorization", "Bearer x"))))
+    expected = JSONResponse(status_code=402, content={
+        "error": "Phone verification required",
+        "verify_url": "https://modelex.ai/verify"
+    })
+    assert result.status_code == 402
+    assert result.body == expected.body
+    assert result.headers["content-type"] == expected.headers["content-type"]
+
+
+def test_phone_verified_calls_endpoint(verify_jwt):
+    request = _request(("Authorization", "Bearer x"), ("X-Phone-Verified", "true"))
+    assert asyncio.run(phone_endpoint(request=request)) == "ok"
@@ -0,0 +1,88 @@
+import hashlib
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from adapters import payment
+
+
+@pytest.fixture(autouse=True)
+def clear_jwt_cache():
+    payment._jwt_cache.clear()
+    yield
+    payment._jwt_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock for payment.time; advance it by bumping clock.now."""
+    fake = SimpleNamespace(now=time.time())
+    fake.time = lambda: fake.now
+    fake.monotonic_ns = lambda: int(fake.now * 1_000_000_000)
+    monkeypatch.setattr(payment, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(payment.jwt, "decode", counting_decode)
+    return calls
+
+
+def _token(**claims):
+    return jwt.encode({"amount": 5, **claims}, payment.SECRET_KEY, algorithm="HS256")
+
+
+def test_verify_jwt_amount():
+    token = _token()
+    assert payment.verify_jwt(token, min_amount=5)
+    assert not payment.verify_jwt(token, min_amount=10)
+
+
+def test_verify_jwt_rejects_bad_signature():
+    token = jwt.encode({"amount": 5}, "not-the-secret", algorithm="HS256")
+    assert not payment.verify_jwt(token, min_amount=1)
+    assert not payment._jwt_cache
+
+
+def test_cache_reuses_decoded_amount(clock, decode_calls):
+    token = _token()
+    assert payment.verify_jwt(token, min_amount=1)
+    clock.now += payment.JWT_CACHE_TTL - 1
+    assert payment.verify_jwt(token, min_amount=1)
+    assert len(decode_calls) == 1
+
+    clock.now += 2
+    assert payment.verify_jwt(token, min_amount=1)
+    assert len(decode_calls) == 2
+
+
+def test_cache_respects_jwt_exp(clock, decode_calls):
+    token = _token(exp=int(clock.now) + 2)
+    assert payment.verify_jwt(token, min_amount=1)
+    assert payment.verify_jwt(token, min_amount=1)
+    assert len(decode_calls) == 1
+
+    # Well within JWT_CACHE_TTL, but past the token's exp
+    clock.now += 3
+    payment.verify_jwt(token, min_amount=1)
+    assert len(decode_calls) == 2
+
+
+def test_cache_key_is_peppered_digest():
+    token = _token()
+    payment.verify_jwt(token, min_amount=1)
+    (key,) = payment._jwt_cache
+    assert key != hashlib.blake2b(token.encode(), digest_size=16).digest()
+    assert key == hashlib.blake2b(
+        token.encode(), digest_size=16, key=payment._JWT_CACHE_PEPPER
+    ).digest()
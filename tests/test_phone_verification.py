@@ -0,0 +1,46 @@
+from unittest.mock import Mock
+
+import pytest
+from starlette.datastructures import Headers
+from starlette.requests import Request
+
+from adapters.phone_verification import check_phone_verified
+
+
+def _asgi_request(headers):
+    return Request({
+        "type": "http",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("true", True),
+    ("TRUE", True),
+    ("false", False),
+    ("yes", False),
+])
+def test_check_phone_verified_from_scope(value, expected):
+    assert check_phone_verified(_asgi_request({"X-Phone-Verified": value})) is expected
+
+
+def test_check_phone_verified_missing_header():
+    assert check_phone_verified(_asgi_request({})) is False
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"X-Phone-Verified": "true"}, True),
+    ({"x-phone-verified": "true"}, True),
+    ({"x-phone-verified": "false"}, False),
+    ({}, False),
+])
+def test_check_phone_verified_headers_fallback(headers, expected):
+    # Non-ASGI double: Mock().scope is not a dict, so .headers is used
+    request = Mock(headers=Headers(headers))
+    assert check_phone_verified(request) is expected
+
+
+def test_check_phone_verified_headers_fallback_non_latin1():
+    # starlette Headers can't hold this value; other request types can
+    request = Mock(headers={"X-Phone-Verified": "\u2713"})
+    assert check_phone_verified(request) is False